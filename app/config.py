@@ -15,6 +15,14 @@ DATA_DIR   = ROOT_DIR / "data"
 LOG_FILE   = SCRIPT_DIR / "log.txt"
 
 
+# Last (date, ISO string) returned by today_iso()
+_TODAY: list = [None, None]
+
+
 def today_iso() -> str:
     """Return today's date as YYYY-MM-DD (ISO format)."""
-    return date.today().isoformat()
+    d = date.today()
+    if d != _TODAY[0]:
+        _TODAY[0] = d
+        _TODAY[1] = d.isoformat()
+    return _TODAY[1]
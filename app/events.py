@@ -1,42 +1,96 @@
 # events.py
 # Event logging (log.txt) and history viewing.
 
-from datetime import datetime, timezone
+import atexit
+import mmap
+import os
+import time
 
 from config import LOG_FILE
 
+# Event lines not yet written to log.txt (see flush_events)
+_PENDING_LOG: list[str] = []
+
+# Last (epoch second, formatted timestamp) returned by _timestamp()
+_STAMP: list = [None, ""]
+
+
+def _timestamp() -> str:
+    """
+    Return the current UTC time as YYYY-MM-DDTHH:MM:SSZ.
+    """
+    now = int(time.time())
+    if now != _STAMP[0]:
+        _STAMP[0] = now
+        _STAMP[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return _STAMP[1]
+
 
 def log_event(message: str) -> None:
     """
     Append a timestamped event line to log.txt.
+
+    Lines are collected in memory and written by flush_events(), which
+    main() calls once per invocation (and which also runs at exit).
     """
-    # timezone-aware UTC timestamp
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    # Normalize "+00:00" to "Z" for nicer display
-    if timestamp.endswith("+00:00"):
-        timestamp = timestamp[:-6] + "Z"
+    if not _PENDING_LOG:
+        atexit.register(flush_events)
+    _PENDING_LOG.append(f"{_timestamp()} {message}\n")
 
-    line = f"{timestamp} {message}\n"
-    with LOG_FILE.open("a", encoding="utf-8") as f:
-        f.write(line)
+
+def flush_events() -> None:
+    """
+    Write all pending event lines to log.txt with a single append write.
+    """
+    if not _PENDING_LOG:
+        return
+
+    atexit.unregister(flush_events)
+    # One O_APPEND write: the kernel places it at end of file, so lines
+    # from concurrent invocations never interleave
+    fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, "".join(_PENDING_LOG).encode("utf-8"))
+    finally:
+        os.close(fd)
+    _PENDING_LOG.clear()
 
 
 def show_history(limit: int = 10) -> None:
     """
     Print the last `limit` lines from log.txt (most recent events).
     """
-    if not LOG_FILE.exists():
+    # Make events from this process visible before reading the file back
+    flush_events()
+
+    try:
+        f = LOG_FILE.open("rb")
+    except FileNotFoundError:
         print(f"log-tool: No history yet (log file {LOG_FILE.name} does not exist).")
         return
 
-    with LOG_FILE.open("r", encoding="utf-8") as f:
-        lines = f.read().splitlines()
+    # Map the file and walk back over the last `limit` newlines, so only
+    # the tail pages are ever touched
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = b""  # mmap cannot map an empty file
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                pos = end - 1 if mm[end - 1:end] == b"\n" else end
+                for _ in range(limit):
+                    pos = mm.rfind(b"\n", 0, pos)
+                    if pos == -1:
+                        break
+                data = mm[pos + 1:end]
+
+    lines = data.splitlines()
 
     if not lines:
         print(f"log-tool: History is empty in {LOG_FILE.name}.")
         return
 
-    tail = lines[-limit:]
+    tail = [line.decode("utf-8", "replace") for line in lines[-limit:]]
 
     print(f"log-tool: Last {len(tail)} event(s) from {LOG_FILE.name}:\n")
     for line in tail:
@@ -2,35 +2,414 @@
 # CSV group handling, data-type validation, and core logging logic.
 
 import csv
+import io
+import itertools
+import json
+import mmap
+import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 from config import DATA_DIR, today_iso
 from events import log_event
 
 
+# Parsed group CSVs, keyed by path: (signature, GroupData).
+# The signature is (st_mtime_ns, st_size), so an edited file is re-read.
+_CSV_CACHE: dict[Path, tuple[tuple[int, int], "GroupData"]] = {}
+
+# item_name -> [(group_file, item_col, log_date_col), ...] across all groups.
+# Valid while the (path, signature) list of group files equals _ITEM_INDEX_KEY.
+_ITEM_INDEX: dict[str, list[tuple[Path, int, int | None]]] = {}
+_ITEM_INDEX_KEY: tuple | None = None
+
+# On-disk copy of the item index, so a new process can skip reading headers
+_INDEX_FILE = DATA_DIR / ".index.json"
+
+# First line of a <group>.idx sidecar: the (mtime_ns, size) of the CSV it
+# describes. Fixed width, so it can be rewritten in place after a row save.
+_IDX_HEADER = "# {:020d} {:020d}\n"
+
+# save_group_row only patches a row in place when it lies within one block
+# of this size (one page / filesystem block), so the write cannot be torn
+# across blocks by a crash
+_PATCH_BLOCK = 4096
+
+# Line terminator used when writing (same as csv.writer's default)
+_LINE_END = "\r\n"
+
+# Canonical cell values written by the validators, interned so repeated
+# logs share one string object
+_NA    = sys.intern("N/A")
+_TRUE  = sys.intern("TRUE")
+_FALSE = sys.intern("FALSE")
+
+# Accepted boolean spellings (after strip().lower()) -> canonical cell text
+_BOOL_MAP = {
+    **dict.fromkeys(("t", "true", "y", "yes", "1"), _TRUE),
+    **dict.fromkeys(("f", "false", "n", "no", "0"), _FALSE),
+}
+
+# Inputs that mean "set this cell to N/A" (after strip().lower())
+_NA_INPUTS = frozenset({"na", "n/a"})
+
+# "00".."99", used to zero-pad duration components without a format spec
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+# Loggable column types, as compact codes used for dispatch in log_item.
+# Other types (e.g. current_date) map to None and cannot be logged.
+_INTEGER, _DURATION, _BOOLEAN, _INT_RANGE = range(4)
+_TYPE_CODES = {
+    "integer":   _INTEGER,
+    "duration":  _DURATION,
+    "boolean":   _BOOLEAN,
+    "int_range": _INT_RANGE,
+}
+
+
+class GroupData:
+    """
+    Parsed contents of one group CSV, stored column by column.
+
+    - headers      : header row list
+    - types        : type row list
+    - type_codes   : per-column type code from _TYPE_CODES (None if not loggable)
+    - columns      : one list per column, indexed as columns[col][row]. Cells of
+                     loggable columns hold typed values (int, int seconds, bool)
+                     when their text is canonical; "", "N/A" and anything else
+                     stay as str, so saving reproduces the original text
+    - nrows        : number of data rows
+    - extra        : row index -> cells past the last header, for the rare
+                     row that is longer than the header (kept as text)
+    - date_index   : Log_Date value -> row index (first match wins)
+    - log_date_col : index of the 'Log_Date' column (None if missing)
+    - by_name      : column name -> index (first match wins)
+    """
+    # A hand-written slotted class rather than a dataclass: importing
+    # dataclasses costs about 12 ms, paid by every log and show run.
+    __slots__ = (
+        "headers", "types", "type_codes", "columns", "nrows", "extra",
+        "date_index", "log_date_col", "by_name",
+    )
+
+    def __init__(
+        self,
+        headers: list[str],
+        types: list[str],
+        type_codes: list[int | None],
+        columns: list[list],
+        nrows: int,
+        extra: dict[int, list[str]],
+        date_index: dict[str, int],
+        log_date_col: int | None,
+        by_name: dict[str, int],
+    ):
+        self.headers      = headers
+        self.types        = types
+        self.type_codes   = type_codes
+        self.columns      = columns
+        self.nrows        = nrows
+        self.extra        = extra
+        self.date_index   = date_index
+        self.log_date_col = log_date_col
+        self.by_name      = by_name
+
+    def row(self, row_idx: int) -> list:
+        """
+        Return the cells of one row (typed values, not text).
+        """
+        cells = [column[row_idx] for column in self.columns]
+        if self.extra:
+            cells += self.extra.get(row_idx, ())
+        return cells
+
+    def rows(self):
+        """
+        Iterate over the cells of every data row, in order.
+        """
+        if self.extra or not self.columns:
+            return map(self.row, range(self.nrows))
+        return zip(*self.columns)
+
+    def append_row(self, values) -> int:
+        """
+        Append one row of cells (one per header) and return its row index.
+        """
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self.nrows += 1
+        return self.nrows - 1
+
+    def row_text(self, values) -> list[str]:
+        """
+        Return a row of cells as CSV cell strings.
+        """
+        text = [_cell_text(v, code) for v, code in zip(values, self.type_codes)]
+        text += values[len(text):]  # cells past the header are already text
+        return text
+
+    def copy(self) -> "GroupData":
+        """
+        Return a copy whose cells and index can be mutated independently.
+        """
+        return GroupData(
+            list(self.headers),
+            list(self.types),
+            self.type_codes,
+            [list(column) for column in self.columns],
+            self.nrows,
+            dict(self.extra),
+            dict(self.date_index),
+            self.log_date_col,
+            self.by_name,
+        )
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """
+    Return (mtime_ns, size) for a file, used to detect on-disk changes.
+    """
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _column_map(headers) -> dict[str, int]:
+    """
+    Return {column_name: index}; the first occurrence of a name wins,
+    as with headers.index().
+    """
+    columns: dict[str, int] = {}
+    for i, h in enumerate(headers):
+        columns.setdefault(h, i)
+    return columns
+
+
+def _build_date_index(columns, log_date_col: int | None) -> dict[str, int]:
+    """
+    Return {log_date: row_index} from the Log_Date column.
+    Returns an empty index if there is no 'Log_Date' column.
+    """
+    if log_date_col is None:
+        return {}
+
+    date_index: dict[str, int] = {}
+    for i, log_date in enumerate(columns[log_date_col]):
+        date_index.setdefault(log_date, i)
+    return date_index
+
+
+def _parse_csv_text(text: str) -> list[list[str]]:
+    """
+    Split CSV text into rows.
+
+    Group CSVs hold dates, numbers, durations and TRUE/FALSE, so the common
+    case is a plain split on newlines and commas. Text containing a quote
+    character, or a bare "\r" (which csv also treats as a line break), goes
+    through csv.reader instead. Only "\n" and "\r\n" end a row here:
+    str.splitlines() would also break on characters like "\x0c" or
+    "\u2028" inside a cell. A blank line gives [], as it does from csv.
+    """
+    if '"' in text or text.count("\r") != text.count("\r\n"):
+        return list(csv.reader(io.StringIO(text, newline="")))
+
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # text ends with a line break (or is empty)
+    return [line.rstrip("\r").split(",") if line not in ("", "\r") else [] for line in lines]
+
+
+def _format_csv_text(rows) -> str:
+    """
+    Join rows into CSV text. Falls back to csv.writer if any cell needs quoting.
+    """
+    text = "".join(",".join(row) + _LINE_END for row in rows)
+
+    # The cells are safe iff the joined text holds no quotes and exactly the
+    # commas and line breaks we added ourselves (str.count runs in C).
+    if (
+        '"' not in text
+        and text.count(",") == sum(len(row) - 1 for row in rows if row)
+        and text.count("\n") == len(rows)
+        and text.count("\r") == len(rows)
+    ):
+        return text
+
+    buf = io.StringIO(newline="")
+    csv.writer(buf, lineterminator=_LINE_END).writerows(rows)
+    return buf.getvalue()
+
+
 def list_group_files() -> list[Path]:
     """
     Return a sorted list of all .csv files under DATA_DIR.
     Each file is treated as a 'group' CSV.
     """
-    if not DATA_DIR.exists():
+    # scandir's DirEntry.is_file() uses the type from the directory listing,
+    # so this costs no stat() per entry
+    try:
+        with os.scandir(DATA_DIR) as it:
+            names = [e.name for e in it if e.name.endswith(".csv") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         raise RuntimeError(f"Data directory not found: {DATA_DIR}")
 
-    files = [p for p in DATA_DIR.glob("*.csv") if p.is_file()]
-    if not files:
+    if not names:
         raise RuntimeError(f"No group CSV files found in {DATA_DIR}")
-    return sorted(files)
+    names.sort()
+    return [DATA_DIR / name for name in names]
 
 
-def load_group_csv(group_file: Path):
+def load_group_meta(group_file: Path) -> tuple[list[str], list[str]]:
     """
-    Load a specific group CSV and return (headers, types, rows).
+    Read only the first two rows of a group CSV and return (headers, types).
     """
-    if not group_file.exists():
+    try:
+        f = group_file.open("r", newline="", encoding="utf-8")
+    except FileNotFoundError:
         raise RuntimeError(f"Group CSV not found: {group_file}")
 
-    with group_file.open("r", newline="", encoding="utf-8") as f:
-        reader = list(csv.reader(f))
+    with f:
+        lines = [f.readline(), f.readline()]
+        if '"' in lines[0] or '"' in lines[1]:
+            # Quoted cells may hide commas or newlines: let csv handle them
+            f.seek(0)
+            meta = list(itertools.islice(csv.reader(f), 2))
+        else:
+            # Plain rows split the same way csv would ("" at EOF is no row)
+            meta = [
+                line.rstrip("\r\n").split(",") if line.rstrip("\r\n") else []
+                for line in lines if line
+            ]
+
+    if len(meta) < 2:
+        raise RuntimeError(f"{group_file.name} must have at least 2 rows (header + types).")
+
+    return meta[0], meta[1]
+
+
+def _meta_block(group_file: Path) -> bytes:
+    """
+    Return the raw bytes of the first two lines (header and type rows).
+    """
+    with open(group_file, "rb") as f:
+        return f.readline() + f.readline()
+
+
+def _read_index_file(index_key):
+    """
+    Return (index, blocks, stale) for the item index stored in .index.json,
+    or None if it is missing, malformed, or no longer matches the group files.
+
+    A file whose signature changed since the index was built (every log
+    changes one) is still covered if its first two lines are unchanged,
+    which costs one short read instead of an index rewrite on every save.
+    stale is True when any such read was needed, so the caller can store
+    the current signatures and skip those reads on later runs.
+    """
+    try:
+        with _INDEX_FILE.open("r", encoding="utf-8") as f:
+            stored = json.load(f)
+        files = stored["files"]
+        if [entry[0] for entry in files] != [p.name for p, _ in index_key]:
+            return None
+        blocks = []
+        stale  = False
+        for (_, mtime_ns, size, block), (p, sig) in zip(files, index_key):
+            block = str.encode(block, "utf-8", "surrogateescape")
+            blocks.append(block)
+            if (mtime_ns, size) == sig:
+                continue
+            if _meta_block(p) != block:
+                return None
+            stale = True
+        index = {
+            item: [(DATA_DIR / name, col, log_date_col) for name, col, log_date_col in entries]
+            for item, entries in dict(stored["items"]).items()
+        }
+        return index, blocks, stale
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # unreadable or malformed: rebuild
+
+
+def _write_index_file(index_key, blocks, index) -> None:
+    """
+    Write the item index to .index.json, together with the (name, mtime_ns,
+    size, header block) of each group file it was built from.
+    """
+    stored = {
+        "files": [
+            [p.name, *sig, block.decode("utf-8", "surrogateescape")]
+            for (p, sig), block in zip(index_key, blocks)
+        ],
+        "items": {
+            item: [[p.name, col, log_date_col] for p, col, log_date_col in entries]
+            for item, entries in index.items()
+        },
+    }
+    tmp_file = _INDEX_FILE.with_name(_INDEX_FILE.name + ".tmp")
+    tmp_file.write_text(json.dumps(stored), encoding="utf-8")
+    os.replace(tmp_file, _INDEX_FILE)
+
+
+def build_item_index() -> dict[str, list[tuple[Path, int, int | None]]]:
+    """
+    Return {item_name: [(group_file, item_col, log_date_col), ...]} for every
+    column of every group CSV under DATA_DIR.
+
+    log_date_col is None for a group with no 'Log_Date' column. The index is
+    kept in memory and in DATA_DIR/.index.json, and is only rebuilt (from the
+    header rows) when the set of group CSVs or any file's header rows change.
+    When only signatures changed (e.g. after logging), .index.json is
+    rewritten with the current ones, so the next run opens no CSVs for lookup.
+    """
+    global _ITEM_INDEX, _ITEM_INDEX_KEY
+
+    group_files = list_group_files()
+    index_key = tuple((p, _file_signature(p)) for p in group_files)
+
+    if index_key == _ITEM_INDEX_KEY:
+        return _ITEM_INDEX
+
+    stored = _read_index_file(index_key)
+    if stored is not None:
+        index, blocks, stale = stored
+        if stale:
+            _write_index_file(index_key, blocks, index)
+    else:
+        index = {}
+        for group_file in group_files:
+            headers, _ = load_group_meta(group_file)
+
+            columns      = _column_map(headers)
+            log_date_col = columns.get("Log_Date")
+            for h, i in columns.items():
+                index.setdefault(h, []).append((group_file, i, log_date_col))
+        _write_index_file(index_key, [_meta_block(p) for p in group_files], index)
+
+    _ITEM_INDEX, _ITEM_INDEX_KEY = index, index_key
+    return index
+
+
+def load_group_csv(group_file: Path) -> GroupData:
+    """
+    Load a specific group CSV and return its GroupData.
+
+    Parsed files are cached for the lifetime of the process and only
+    re-read when their mtime or size changes. Callers get their own copy
+    of the rows, so mutating them does not touch the cache.
+    """
+    try:
+        signature = _file_signature(group_file)
+    except FileNotFoundError:
+        raise RuntimeError(f"Group CSV not found: {group_file}")
+
+    cached = _CSV_CACHE.get(group_file)
+
+    if cached is not None and cached[0] == signature:
+        return cached[1].copy()
+
+    reader = _parse_csv_text(group_file.read_bytes().decode("utf-8"))
 
     if len(reader) < 2:
         raise RuntimeError(f"{group_file.name} must have at least 2 rows (header + types).")
@@ -38,18 +417,281 @@ def load_group_csv(group_file: Path):
     headers = reader[0]
     types   = reader[1]
     rows    = reader[2:]
-    return headers, types, rows
+
+    # Normalize rows to the header width once: short rows are padded, and
+    # cells past the header are set aside in `extra` so they are saved back
+    # unchanged. Then transpose into one list per column.
+    ncols = len(headers)
+    extra: dict[int, list[str]] = {}
+    for i, row in enumerate(rows):
+        if len(row) < ncols:
+            row += [""] * (ncols - len(row))
+        elif len(row) > ncols:
+            extra[i] = row[ncols:]
+            del row[ncols:]
+
+    columns = [list(column) for column in zip(*rows)] if rows and ncols else [[] for _ in range(ncols)]
+
+    type_codes = [_TYPE_CODES.get(t) for t in types[:ncols]]
+    type_codes += [None] * (ncols - len(type_codes))
+
+    by_name      = _column_map(headers)
+    log_date_col = by_name.get("Log_Date")
+
+    # Convert canonical cells of loggable columns to typed values once, so
+    # logging does not re-parse text. Anything else stays as-is, which keeps
+    # untouched cells byte-identical when the file is saved again.
+    # Free-text columns (other than the unique Log_Date) tend to repeat a
+    # few values, so their cells are interned to share one object each.
+    for j, code in enumerate(type_codes):
+        from_text = _FROM_TEXT.get(code)
+        if from_text is not None:
+            columns[j] = [from_text(cell) for cell in columns[j]]
+        elif j != log_date_col:
+            columns[j] = list(map(sys.intern, columns[j]))
+    group = GroupData(
+        headers,
+        types,
+        type_codes,
+        columns,
+        len(rows),
+        extra,
+        _build_date_index(columns, log_date_col),
+        log_date_col,
+        by_name,
+    )
+
+    _CSV_CACHE[group_file] = (signature, group)
+    return group.copy()
+
+
+def save_group_csv(group_file: Path, group: GroupData) -> None:
+    """
+    Save a GroupData (headers, types, cells) back to the given group CSV.
+
+    The data is written and fsync'ed to a sibling .tmp file first and then
+    moved over the original, so an interrupted write never leaves a
+    half-written CSV.
+    """
+    text_rows = [group.headers, group.types, *map(group.row_text, group.rows())]
+    data = _format_csv_text(text_rows).encode("utf-8")
+    tmp_file = group_file.with_name(group_file.name + ".tmp")
+
+    with open(tmp_file, "wb", buffering=1 << 20) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, group_file)
+
+    # Keep the cache and the date-offset sidecar in sync with what we just wrote
+    _CSV_CACHE[group_file] = (_file_signature(group_file), group.copy())
+    if group.log_date_col is not None:
+        _write_date_offsets(group_file, _scan_date_offsets(data, group.log_date_col))
+
+
+def _row_bytes(row) -> bytes:
+    """
+    Serialize one row the way save_group_csv would, without the line terminator.
+    """
+    return _format_csv_text([row])[:-len(_LINE_END)].encode("utf-8")
+
+
+def _append_line(group_file: Path, body: bytes) -> int | None:
+    """
+    Append `body` as one line to `group_file`, reusing the file's own line
+    terminator, with a single O_APPEND os.write. Returns the byte offset the
+    line starts at, or None (nothing written) if the file does not end with
+    a newline.
+    """
+    fd = os.open(group_file, os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        os.lseek(fd, max(0, size - 2), os.SEEK_SET)
+        tail = os.read(fd, 2)
+        if not tail.endswith(b"\n"):
+            return None
+        os.write(fd, body + (b"\r\n" if tail.endswith(b"\r\n") else b"\n"))
+        os.fsync(fd)
+        return size
+    finally:
+        os.close(fd)
+
+
+def save_group_row(group_file: Path, group: GroupData, log_date: str, old_row) -> None:
+    """
+    Persist the row for `log_date` after it changed (old_row is its previous
+    contents as a tuple) or was appended (old_row is None).
+
+    Rather than rewriting the whole CSV:
+      - a new date is appended to the end of the file;
+      - an existing row whose serialized length is unchanged is overwritten
+        in place at its byte offset (taken from the <group>.idx sidecar).
+
+    Anything else (different length, row not where the sidecar says, no
+    Log_Date column, ...) falls back to a full save_group_csv().
+
+    Durability: unlike save_group_csv's tmp file + rename, these write into
+    the live file. A patch is only done when the row sits inside one
+    _PATCH_BLOCK-aligned block, so it is a single small write that the
+    filesystem does not split; other patches take the atomic path. An append
+    interrupted by a crash can at worst leave a partial last row without a
+    terminator; the next append sees the missing newline and falls back to
+    a full rewrite instead of gluing a row onto it.
+    """
+    if group.log_date_col is None:
+        save_group_csv(group_file, group)
+        return
+
+    offsets  = load_date_offsets(group_file, group.log_date_col)
+    new_body = _row_bytes(group.row_text(group.row(group.date_index[log_date])))
+    patched  = False
+    appended = None
+
+    if old_row is None:
+        if log_date not in offsets:
+            offset = _append_line(group_file, new_body)
+            if offset is not None:
+                offsets[log_date] = offset
+                appended = (log_date, offset)
+                patched = True
+    else:
+        offset = offsets.get(log_date)
+        if offset is not None and offset // _PATCH_BLOCK == (offset + len(new_body) - 1) // _PATCH_BLOCK:
+            with open(group_file, "r+b") as f:
+                f.seek(offset)
+                old_body = f.readline().rstrip(b"\r\n")
+                if old_body == _row_bytes(group.row_text(old_row)) and len(new_body) == len(old_body):
+                    f.seek(offset)
+                    f.write(new_body)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    patched = True
+
+    if not patched:
+        save_group_csv(group_file, group)
+        return
+
+    # Keep the cache and the date-offset sidecar in sync with the file. Only
+    # one sidecar line is added (append) or none at all (patch: no offsets
+    # move); the full rewrite is the fallback for an unexpected sidecar.
+    _CSV_CACHE[group_file] = (_file_signature(group_file), group.copy())
+    if not _update_date_offsets(group_file, appended):
+        _write_date_offsets(group_file, offsets)
 
 
-def save_group_csv(group_file: Path, headers, types, rows) -> None:
+def _scan_date_offsets(data: bytes, log_date_col: int) -> dict[str, int]:
     """
-    Save (headers, types, rows) back to the given group CSV.
+    Return {log_date: byte_offset} for the data rows in raw group CSV bytes.
+    Each offset points at the start of the row's line; first row per date wins.
     """
-    with group_file.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerow(types)
-        writer.writerows(rows)
+    offsets: dict[str, int] = {}
+    pos = 0
+    maxsplit = log_date_col + 1
+
+    for lineno, line in enumerate(data.splitlines(keepends=True)):
+        if lineno >= 2:
+            if b'"' in line:
+                cells = next(csv.reader([line.decode("utf-8")]), [])
+                log_date = cells[log_date_col] if len(cells) > log_date_col else None
+            else:
+                # Only split as far as the Log_Date cell and decode just that
+                cells = line.rstrip(b"\r\n").split(b",", maxsplit)
+                log_date = cells[log_date_col].decode("utf-8") if len(cells) > log_date_col else None
+            if log_date is not None:
+                offsets.setdefault(log_date, pos)
+        pos += len(line)
+
+    return offsets
+
+
+def _write_date_offsets(group_file: Path, offsets: dict[str, int]) -> None:
+    """
+    Write the <group>.idx sidecar: an _IDX_HEADER line for the CSV it
+    describes, then one "<log_date> <byte_offset>" line per date.
+    """
+    lines = [_IDX_HEADER.format(*_file_signature(group_file))]
+    lines.extend(f"{d} {offset}\n" for d, offset in offsets.items())
+
+    idx_file = group_file.with_suffix(".idx")
+    tmp_file = idx_file.with_name(idx_file.name + ".tmp")
+    tmp_file.write_text("".join(lines), encoding="utf-8")
+    os.replace(tmp_file, idx_file)
+
+
+def _update_date_offsets(group_file: Path, appended) -> bool:
+    """
+    Bring a current <group>.idx sidecar up to date after save_group_row wrote
+    to the CSV: add the "<log_date> <byte_offset>" line for an appended row
+    (appended is (log_date, offset), or None for an in-place patch), then
+    rewrite the header with the CSV's new signature.
+
+    Returns False (nothing written) if the sidecar is missing or its header
+    is not the fixed-width form; the caller then rewrites it in full.
+    """
+    idx_file = group_file.with_suffix(".idx")
+    header_len = len(_IDX_HEADER.format(0, 0))
+
+    try:
+        with open(idx_file, "r+b") as f:
+            if len(f.readline()) != header_len:
+                return False
+            if appended is not None:
+                # The line goes in before the header marks the sidecar as
+                # current, so a crash in between only leaves it stale
+                f.seek(0, 2)
+                f.write("{} {}\n".format(*appended).encode("utf-8"))
+                f.flush()
+            f.seek(0)
+            f.write(_IDX_HEADER.format(*_file_signature(group_file)).encode("ascii"))
+    except OSError:
+        return False
+    return True
+
+
+def _read_date_offsets(group_file: Path) -> dict[str, int] | None:
+    """
+    Return {log_date: byte_offset} from the <group>.idx sidecar, or None if it
+    is missing, unreadable, or was written for a different version of the
+    file (mtime/size mismatch).
+    """
+    idx_file = group_file.with_suffix(".idx")
+    expected = _IDX_HEADER.format(*_file_signature(group_file))
+
+    try:
+        with idx_file.open("r", encoding="utf-8") as f:
+            if f.readline() != expected:
+                return None
+            offsets: dict[str, int] = {}
+            for line in f:
+                d, offset = line.rstrip("\n").rsplit(" ", 1)
+                offsets[d] = int(offset)
+            return offsets
+    except (OSError, ValueError):
+        return None
+
+
+def load_date_offsets(group_file: Path, log_date_col: int) -> dict[str, int]:
+    """
+    Return {log_date: byte_offset} for a group CSV from its <group>.idx sidecar.
+    The sidecar is rebuilt from the CSV if it is not current.
+    """
+    offsets = _read_date_offsets(group_file)
+    if offsets is None:
+        offsets = _scan_date_offsets(group_file.read_bytes(), log_date_col)
+        _write_date_offsets(group_file, offsets)
+    return offsets
+
+
+def _plain_int(value_str: str) -> int | None:
+    """
+    Return the integer for an optionally signed run of ASCII digits
+    (surrounding spaces allowed), or None for anything else.
+    """
+    s = value_str.strip()
+    digits = s[1:] if s[:1] == "-" else s
+    if digits.isdigit() and digits.isascii():
+        return int(s)
+    return None
 
 
 def validate_integer(value_str: str) -> int:
@@ -57,6 +699,11 @@ def validate_integer(value_str: str) -> int:
     Validate that a string can be converted to an integer.
     Return the integer.
     """
+    parsed_int = _plain_int(value_str)
+    if parsed_int is not None:
+        return parsed_int
+
+    # Anything int() accepts beyond plain digits ("+5", "1_000", ...)
     try:
         parsed_int = int(value_str)
     except ValueError:
@@ -68,8 +715,7 @@ def is_na_input(value_str: str) -> bool:
     """
     Return True if the user explicitly wants to set this cell to N/A.
     """
-    s = value_str.strip().lower()
-    return s in ("na", "n/a")
+    return value_str.strip().lower() in _NA_INPUTS
 
 
 def validate_boolean(value_str: str) -> str:
@@ -80,19 +726,12 @@ def validate_boolean(value_str: str) -> str:
       - truthy:  t, true, y, yes, 1
       - falsy:   f, false, n, no, 0
     """
-    s = value_str.strip().lower()
-
-    truthy = {"t", "true", "y", "yes", "1"}
-    falsy  = {"f", "false", "n", "no", "0"}
-
-    if s in truthy:
-        return "TRUE"
-    if s in falsy:
-        return "FALSE"
-
-    raise ValueError(
-        "Boolean value must be one of: t/f, true/false, y/n, yes/no, 1/0."
-    )
+    value = _BOOL_MAP.get(value_str.strip().lower())
+    if value is None:
+        raise ValueError(
+            "Boolean value must be one of: t/f, true/false, y/n, yes/no, 1/0."
+        )
+    return value
 
 
 def validate_int_range(value_str: str) -> int:
@@ -102,10 +741,12 @@ def validate_int_range(value_str: str) -> int:
     - Must be an integer
     - Must be between 1 and 10 (inclusive)
     """
-    try:
-        value_int = int(value_str)
-    except ValueError:
-        raise ValueError("int_range value must be an integer between 1 and 10.")
+    value_int = _plain_int(value_str)
+    if value_int is None:
+        try:
+            value_int = int(value_str)
+        except ValueError:
+            raise ValueError("int_range value must be an integer between 1 and 10.")
 
     if not 1 <= value_int <= 10:
         raise ValueError("int_range value must be between 1 and 10.")
@@ -113,6 +754,33 @@ def validate_int_range(value_str: str) -> int:
     return value_int
 
 
+def _two_digits(s: str, i: int) -> int:
+    """
+    Return the value of the two ASCII digits at s[i:i+2], or -1 if either
+    character is not a digit.
+    """
+    hi = ord(s[i]) - 48
+    lo = ord(s[i + 1]) - 48
+    if 0 <= hi <= 9 and 0 <= lo <= 9:
+        return hi * 10 + lo
+    return -1
+
+
+def _parse_hhmmss(s: str) -> int | None:
+    """
+    Return total seconds for a canonical "hh:mm:ss" string (the form that
+    format_seconds_as_duration writes for under 100 hours), else None.
+    """
+    if len(s) == 8 and s[2] == ":" and s[5] == ":":
+        hh = _two_digits(s, 0)
+        mm = _two_digits(s, 3)
+        ss = _two_digits(s, 6)
+        if hh >= 0 and 0 <= mm < 60 and 0 <= ss < 60:
+            return hh * 3600 + mm * 60 + ss
+    return None
+
+
+@lru_cache(maxsize=4096)
 def parse_duration_to_seconds(value_str: str) -> int:
     """
     Parse a duration string into total seconds.
@@ -125,6 +793,18 @@ def parse_duration_to_seconds(value_str: str) -> int:
       "30:00"    -> 1800
       "01:15:30" -> 4530
     """
+    # Fast path for the fixed-width forms ("mm:ss", "hh:mm:ss") that we write
+    # ourselves; anything irregular falls through to the general parser.
+    seconds = _parse_hhmmss(value_str)
+    if seconds is not None:
+        return seconds
+    if len(value_str) == 5 and value_str[2] == ":":
+        mm = _two_digits(value_str, 0)
+        ss = _two_digits(value_str, 3)
+        if 0 <= mm < 60 and 0 <= ss < 60:
+            return mm * 60 + ss
+
+    # General form: each field is whatever int() accepts
     parts = value_str.split(":")
 
     if len(parts) == 2:
@@ -158,12 +838,146 @@ def format_seconds_as_duration(total_seconds: int) -> str:
     if total_seconds < 0:
         raise ValueError("Duration cannot be negative.")
 
-    hh = total_seconds // 3600
-    remainder = total_seconds % 3600
-    mm = remainder // 60
-    ss = remainder % 60
+    hh, remainder = divmod(total_seconds, 3600)
+    mm, ss = divmod(remainder, 60)
+
+    if hh < 100:
+        return f"{_TWO_DIGITS[hh]}:{_TWO_DIGITS[mm]}:{_TWO_DIGITS[ss]}"
+    return f"{hh:02d}:{_TWO_DIGITS[mm]}:{_TWO_DIGITS[ss]}"
+
+
+def _int_or_text(cell: str):
+    """
+    Return int(cell) if cell is canonical integer text (what str() gives back), else cell.
+    """
+    digits = cell[1:] if cell[:1] == "-" else cell
+    if digits.isdigit() and digits.isascii():
+        value = int(cell)
+        if str(value) == cell:
+            return value
+    return sys.intern(cell)  # "", "N/A", ...: share one object per value
+
+
+@lru_cache(maxsize=4096)
+def _duration_or_text(cell: str):
+    """
+    Return int seconds if cell is canonical hh:mm:ss, else cell.
+    Cached: a log repeats the same few durations on many rows.
+    """
+    seconds = _parse_hhmmss(cell)
+    return cell if seconds is None else seconds
+
+
+def _bool_or_text(cell: str):
+    """
+    Return True/False for TRUE/FALSE, else cell.
+    """
+    if cell == _TRUE:
+        return True
+    if cell == _FALSE:
+        return False
+    return sys.intern(cell)
+
+
+def _bool_text(value: bool) -> str:
+    """
+    Format a boolean cell as TRUE/FALSE.
+    """
+    return _TRUE if value else _FALSE
+
+
+# Type code -> converter from cell text to a typed value (or the text unchanged)
+_FROM_TEXT = {
+    _INTEGER:   _int_or_text,
+    _DURATION:  _duration_or_text,
+    _BOOLEAN:   _bool_or_text,
+    _INT_RANGE: _int_or_text,
+}
+
+# Type code -> formatter from a typed value back to cell text
+_TO_TEXT = {
+    _INTEGER:   str,
+    _DURATION:  format_seconds_as_duration,
+    _BOOLEAN:   _bool_text,
+    _INT_RANGE: str,
+}
+
+
+def _cell_text(value, code: int | None) -> str:
+    """
+    Return the CSV text for one cell of a column with the given type code.
+    """
+    if type(value) is str:
+        return value
+    return _TO_TEXT[code](value)
+
+
+def _handle_integer(column: list, row_idx: int, value_str: str):
+    """
+    integer behavior: SET. Returns (previous, value).
+    """
+    value_int = validate_integer(value_str)
+    previous  = _cell_text(column[row_idx], _INTEGER) or "N/A"
+    column[row_idx] = value_int
+    return previous, str(value_int)
+
+
+def _handle_duration(column: list, row_idx: int, value_str: str):
+    """
+    duration behavior: ADD to existing, stored as hh:mm:ss. Returns (previous, value).
+
+    The cell is left holding int seconds; it is formatted when saved.
+    """
+    added_seconds = parse_duration_to_seconds(value_str)
+
+    existing = column[row_idx]
+    existing_str = existing.strip() if type(existing) is str else ""
+    if type(existing) is int:
+        existing_seconds = existing
+    elif existing_str and existing_str != "N/A":
+        try:
+            existing_seconds = parse_duration_to_seconds(existing_str)
+        except ValueError:
+            # If the existing data is bad, treat as 0 for now
+            existing_seconds = 0
+    else:
+        existing_seconds = 0
+
+    new_total_seconds = existing_seconds + added_seconds
+    previous = format_seconds_as_duration(existing_seconds)
+    value    = format_seconds_as_duration(new_total_seconds)
+
+    column[row_idx] = new_total_seconds
+    return previous, value
+
+
+def _handle_boolean(column: list, row_idx: int, value_str: str):
+    """
+    boolean behavior: SET, stored as TRUE/FALSE. Returns (previous, value).
+    """
+    value    = validate_boolean(value_str)
+    previous = _cell_text(column[row_idx], _BOOLEAN) or "N/A"
+    column[row_idx] = value == _TRUE
+    return previous, value
+
+
+def _handle_int_range(column: list, row_idx: int, value_str: str):
+    """
+    int_range behavior: SET, 1–10. Returns (previous, value).
+    """
+    value_int = validate_int_range(value_str)
+    previous  = _cell_text(column[row_idx], _INT_RANGE) or "N/A"
+    column[row_idx] = value_int
+    return previous, str(value_int)
+
 
-    return f"{hh:02d}:{mm:02d}:{ss:02d}"
+# Type code -> handler(column, row_idx, value_str) -> (previous, value)
+_HANDLERS = {
+    _INTEGER:   _handle_integer,
+    _DURATION:  _handle_duration,
+    _BOOLEAN:   _handle_boolean,
+    _INT_RANGE: _handle_int_range,
+}
 
 
 def find_item_location(item_name: str):
@@ -171,46 +985,38 @@ def find_item_location(item_name: str):
     Search all group CSV files under DATA_DIR for a column named `item_name`.
 
     Returns a tuple:
-      (group_file, headers, types, rows, item_col, log_date_col)
+      (group_file, group, item_col, log_date_col)
 
     - group_file   : Path to the CSV file for that group
-    - headers      : header row list
-    - types        : type row list
-    - rows         : data rows list
+    - group        : GroupData for that group
     - item_col     : index of the item column
     - log_date_col : index of the 'Log_Date' column
 
     For now, we require that item names are unique across all groups.
+    Only the matching group's rows are loaded.
     """
-    matches = []
-
-    for group_file in list_group_files():
-        headers, types, rows = load_group_csv(group_file)
-
-        if item_name in headers:
-            item_col = headers.index(item_name)
-            try:
-                log_date_col = headers.index("Log_Date")
-            except ValueError:
-                raise RuntimeError(f"{group_file.name} has no 'Log_Date' column.")
-
-            matches.append((group_file, headers, types, rows, item_col, log_date_col))
+    matches = build_item_index().get(item_name)
 
     if not matches:
         raise RuntimeError(
             f"Item {item_name!r} not found in any group CSV in {DATA_DIR}."
         )
 
+    for group_file, _, log_date_col in matches:
+        if log_date_col is None:
+            raise RuntimeError(f"{group_file.name} has no 'Log_Date' column.")
+
     if len(matches) > 1:
         details = ", ".join(
-            f"{m[0].name} (col {m[4]})" for m in matches
+            f"{m[0].name} (col {m[1]})" for m in matches
         )
         raise RuntimeError(
             f"Item {item_name!r} found in multiple group files: {details}. "
             "This version requires item names to be unique across all groups."
         )
 
-    return matches[0]
+    group_file, item_col, log_date_col = matches[0]
+    return group_file, load_group_csv(group_file), item_col, log_date_col
 
 
 def log_item(item_name: str, value_str: str, log_date: str | None = None) -> None:
@@ -236,104 +1042,142 @@ def log_item(item_name: str, value_str: str, log_date: str | None = None) -> Non
         log_date = today_iso()
 
     # 2) Find which group + column this item belongs to
-    (
-        group_file,
-        headers,
-        types,
-        rows,
-        item_col,
-        log_date_col,
-    ) = find_item_location(item_name)
+    group_file, group, item_col, log_date_col = find_item_location(item_name)
 
     group_name = group_file.stem
 
     # 3) Look up the item type
-    item_type = types[item_col]
+    item_code = group.type_codes[item_col]
+    handler   = _HANDLERS.get(item_code)
+    column    = group.columns[item_col]
 
     # 4) Find or create the row for this log_date
-    target_row = None
+    row_idx = group.date_index.get(log_date)
 
-    for row in rows:
-        # Ensure row has enough columns (defensive)
-        if len(row) < len(headers):
-            row.extend([""] * (len(headers) - len(row)))
-
-        if row[log_date_col] == log_date:
-            target_row = row
-            break
-
-    if target_row is None:
+    if row_idx is not None:
+        old_row = tuple(group.row(row_idx))
+    else:
         # No row for this date yet → create one
-        target_row = [""] * len(headers)
-        target_row[log_date_col] = log_date
-        rows.append(target_row)
+        new_row = [""] * len(group.columns)
+        new_row[log_date_col] = log_date
+        old_row = None
+        row_idx = group.append_row(new_row)
+        group.date_index[log_date] = row_idx
 
     # 5) Handle 'na' / 'n/a' input first (applies to any type)
     if is_na_input(value_str):
-        previous = target_row[item_col] or "N/A"
-        value    = "N/A"
-        target_row[item_col] = value
+        previous = _cell_text(column[row_idx], item_code) or "N/A"
+        value    = _NA
+        column[row_idx] = value
 
     # 6) Dispatch based on type
-    elif item_type == "integer":
-        # integer behavior: SET
-        value_int = validate_integer(value_str)
-        value     = str(value_int)
-
-        previous = target_row[item_col] or "N/A"
-        target_row[item_col] = value
-
-    elif item_type == "duration":
-        # Duration behavior: ADD to existing
-        added_seconds = parse_duration_to_seconds(value_str)
-
-        existing_str = target_row[item_col].strip() if target_row[item_col] else ""
-        if existing_str and existing_str != "N/A":
-            try:
-                existing_seconds = parse_duration_to_seconds(existing_str)
-            except ValueError:
-                # If the existing data is bad, treat as 0 for now
-                existing_seconds = 0
-        else:
-            existing_seconds = 0
-
-        new_total_seconds = existing_seconds + added_seconds
-        previous = format_seconds_as_duration(existing_seconds)
-        value    = format_seconds_as_duration(new_total_seconds)
-
-        target_row[item_col] = value
-
-    elif item_type == "boolean":
-        # Boolean behavior: SET, stored as TRUE/FALSE
-        value = validate_boolean(value_str)
-        previous = target_row[item_col] or "N/A"
-        target_row[item_col] = value
-
-    elif item_type == "int_range":
-        # int_range behavior: SET, 1–10
-        value_int = validate_int_range(value_str)
-        value     = str(value_int)
-        previous = target_row[item_col] or "N/A"
-        target_row[item_col] = value
-
-    else:
+    elif handler is None:
         raise RuntimeError(
-            f"Column {item_name!r} in group {group_name!r} has unsupported type {item_type!r} "
-            "(supported: integer, duration, boolean, int_range)"
+            f"Column {item_name!r} in group {group_name!r} has unsupported type "
+            f"{group.types[item_col]!r} (supported: integer, duration, boolean, int_range)"
         )
 
-    # 7) Save changes back to disk (to that specific group file)
-    save_group_csv(group_file, headers, types, rows)
+    else:
+        previous, value = handler(column, row_idx, value_str)
+
+    # 7) Save changes back to disk (to that specific group file),
+    #    unless the row is exactly as it was (e.g. re-setting the same value)
+    changed = tuple(group.row(row_idx)) != old_row
+    if changed:
+        save_group_row(group_file, group, log_date, old_row)
 
-    # 8) Log + feedback
+    # 8) Log + feedback (a no-op update is not recorded in log.txt)
     msg = (
         f"log-tool: Updated {item_name} in group {group_name} for {log_date}: "
         f"(prev: {previous}) -> {value}"
     )
-    log_event(msg)
+    if changed:
+        log_event(msg)
     print(msg)
 
 
+# A "\r" that does not start a "\r\n": csv treats it as a line break too
+_BARE_CR = re.compile(rb"\r(?!\n)")
+
+
+def _search_day_row(group_file: Path, log_date: str, log_date_col: int) -> list[str] | None:
+    """
+    Return the first data row of `group_file` whose Log_Date is `log_date`,
+    or None. The file is memory-mapped and searched for the date bytes; only
+    the lines containing a hit are parsed. A file with bare "\r" line breaks
+    is parsed whole instead, since its rows are not split by "\n".
+    """
+    needle = log_date.encode("utf-8")
+    if not needle:
+        return None
+
+    with group_file.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _BARE_CR.search(mm):
+                for cells in _parse_csv_text(mm[:].decode("utf-8"))[2:]:
+                    if len(cells) > log_date_col and cells[log_date_col] == log_date:
+                        return cells
+                return None
+
+            # Data rows start after the header and type rows
+            pos = mm.find(b"\n")
+            pos = mm.find(b"\n", pos + 1) if pos != -1 else -1
+            if pos == -1:
+                return None
+
+            while True:
+                hit = mm.find(needle, pos + 1)
+                if hit == -1:
+                    return None
+                line_start = mm.rfind(b"\n", 0, hit) + 1
+                line_end   = mm.find(b"\n", hit)
+                if line_end == -1:
+                    line_end = len(mm)
+
+                # The date may also appear in another column; check the cell
+                line  = mm[line_start:line_end].decode("utf-8")
+                cells = next(csv.reader([line]), [])
+                if len(cells) > log_date_col and cells[log_date_col] == log_date:
+                    return cells
+                pos = line_end
+
+
+def _find_day_row(group_file: Path, log_date: str):
+    """
+    Return (headers, row) for the first row of `group_file` whose Log_Date is
+    `log_date`, or (None, None) if there is no such row or no Log_Date column.
+
+    The <group>.idx sidecar is checked first: if it is current and lacks the
+    date, the CSV is not opened at all; otherwise only the header and that
+    one row are read. If the sidecar is not current, the file is searched
+    with _search_day_row instead.
+    """
+    offsets = _read_date_offsets(group_file)
+    if offsets is not None and log_date not in offsets:
+        return None, None
+
+    headers, _ = load_group_meta(group_file)
+    log_date_col = _column_map(headers).get("Log_Date")
+
+    if log_date_col is None:
+        return None, None  # malformed group file with no Log_Date
+
+    if offsets is None:
+        # Sidecar is stale (e.g. the CSV was edited by hand): search the file
+        # for just this row rather than rescanning every line. The sidecar
+        # is brought up to date by the next save.
+        row = _search_day_row(group_file, log_date, log_date_col)
+        return (headers, row) if row is not None else (None, None)
+
+    with group_file.open("rb") as f:
+        f.seek(offsets[log_date])
+        line = f.readline().decode("utf-8")
+
+    return headers, next(csv.reader([line]), [])
+
+
 def show_day(log_date: str | None = None) -> None:
     """
     Show the data rows for a given log_date across all group CSVs.
@@ -345,40 +1189,29 @@ def show_day(log_date: str | None = None) -> None:
     if log_date is None:
         log_date = today_iso()
 
-    groups_with_data: list[tuple[str, list[tuple[str, str]]]] = []
+    groups_with_data: list[tuple[str, list[tuple[str, str]], int]] = []
 
     for group_file in list_group_files():
-        headers, types, rows = load_group_csv(group_file)
-        try:
-            log_date_col = headers.index("Log_Date")
-        except ValueError:
-            # Skip malformed group files with no Log_Date
-            continue
-
-        # Find the row for this date
-        target_row = None
-        for row in rows:
-            if len(row) < len(headers):
-                row.extend([""] * (len(headers) - len(row)))
-            if row[log_date_col] == log_date:
-                target_row = row
-                break
+        headers, target_row = _find_day_row(group_file, log_date)
 
         if target_row is None:
             continue  # no data for this date in this group
 
-        # Collect only non-empty cells (including "N/A")
+        # Collect only non-empty cells (including "N/A"), tracking the
+        # widest name as we go
         non_empty = []
+        key_width = 0
         for h, v in zip(headers, target_row):
-            cell = v or ""
-            if cell != "":
-                non_empty.append((h, cell))
+            if v:
+                non_empty.append((h, v))
+                if len(h) > key_width:
+                    key_width = len(h)
 
         if not non_empty:
             continue
 
         group_name = group_file.stem
-        groups_with_data.append((group_name, non_empty))
+        groups_with_data.append((group_name, non_empty, key_width))
 
     if not groups_with_data:
         msg = f"log-tool: No data for {log_date} in any group under {DATA_DIR}"
@@ -389,11 +1222,10 @@ def show_day(log_date: str | None = None) -> None:
     # Log a brief summary of the show operation
     log_event(f"SHOW date={log_date} groups={len(groups_with_data)}")
 
-    print(f"log-tool: Logs for {log_date}\n")
-
-    for group_name, non_empty in groups_with_data:
-        key_width = max(len(h) for h, _ in non_empty)
-        print(f"[Group: {group_name}]")
-        for h, cell in non_empty:
-            print(f"{h.ljust(key_width)} : {cell}")
-        print()  # blank line between groups
+    # Build the whole report and hand it to stdout in one write
+    out = [f"log-tool: Logs for {log_date}\n\n"]
+    for group_name, non_empty, key_width in groups_with_data:
+        out.append(f"[Group: {group_name}]\n")
+        out.extend(f"{h:<{key_width}} : {cell}\n" for h, cell in non_empty)
+        out.append("\n")  # blank line between groups
+    sys.stdout.write("".join(out))
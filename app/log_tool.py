@@ -9,10 +9,23 @@
 #   python3 log_tool.py help    | -h | --help
 
 import sys
+from datetime import date
 
 from config import VERSION
-from events import log_event, show_history
-from groups import log_item, show_day
+from events import flush_events, log_event, show_history
+
+# groups (and its csv/json imports) is only imported by the commands
+# that read group CSVs, so history/version/help start faster.
+
+
+def is_iso_date(text: str) -> bool:
+    """
+    Return True if text is a real calendar date written as YYYY-MM-DD.
+    """
+    try:
+        return date.fromisoformat(text).isoformat() == text
+    except ValueError:
+        return False
 
 
 def print_usage() -> None:
@@ -71,6 +84,125 @@ def print_version() -> None:
     log_event(f"INFO version {VERSION} printed")
 
 
+def _cmd_log(args: list[str]) -> None:
+    """
+    log <ItemName> <Value> [-YYYY-MM-DD]
+    """
+    if len(args) not in (3, 4):
+        msg = "Usage: python3 log_tool.py log <ItemName> <Value> [-YYYY-MM-DD]"
+        print(msg)
+        log_event(f"ERROR {msg}")
+        return
+
+    _, item_name, value_str = args[0:3]
+    log_date = None
+
+    if len(args) == 4:
+        date_flag = args[3]  # expects something like -2026-02-01
+        if not date_flag.startswith("-"):
+            msg = "Date flag must start with '-' and use YYYY-MM-DD, e.g. -2026-02-01"
+            print(msg)
+            log_event(f"ERROR {msg}")
+            return
+        log_date = date_flag[1:]  # strip the leading '-'
+        if not is_iso_date(log_date):
+            msg = f"Invalid date {log_date!r}: use YYYY-MM-DD, e.g. -2026-02-01"
+            print(msg)
+            log_event(f"ERROR {msg}")
+            return
+
+    from groups import log_item
+    log_item(item_name, value_str, log_date=log_date)
+
+
+def _cmd_show(args: list[str]) -> None:
+    """
+    show [YYYY-MM-DD]
+
+      python3 log_tool.py show             -> show today's data across groups
+      python3 log_tool.py show 2026-02-01  -> show data for that date
+    """
+    from groups import show_day
+
+    if len(args) == 1:
+        show_day()
+    elif len(args) == 2:
+        log_date = args[1]
+        if not is_iso_date(log_date):
+            msg = f"Invalid date {log_date!r}: use YYYY-MM-DD, e.g. 2026-02-01"
+            print(msg)
+            log_event(f"ERROR {msg}")
+            return
+        show_day(log_date)
+    else:
+        msg = "Usage: python3 log_tool.py show [YYYY-MM-DD]"
+        print(msg)
+        log_event(f"ERROR {msg}")
+
+
+def _cmd_history(args: list[str]) -> None:
+    """
+    history [N]
+
+      python3 log_tool.py history       -> last 10 events
+      python3 log_tool.py history 20    -> last 20 events
+    """
+    if len(args) == 1:
+        show_history()
+    elif len(args) == 2:
+        try:
+            n = int(args[1])
+            if n <= 0:
+                raise ValueError
+        except ValueError:
+            msg = "history N requires a positive integer N, e.g. 'history 20'."
+            print(msg)
+            log_event(f"ERROR {msg}")
+            return
+        show_history(n)
+    else:
+        msg = "Usage: python3 log_tool.py history [N]"
+        print(msg)
+        log_event(f"ERROR {msg}")
+
+
+def _cmd_version(args: list[str]) -> None:
+    """
+    version | -V | --version
+    """
+    print_version()
+
+
+def _cmd_help(args: list[str]) -> None:
+    """
+    help | commands
+    """
+    print_help()
+
+
+def _cmd_help_flag(args: list[str]) -> None:
+    """
+    -h | --help
+    """
+    print_help()
+    log_event("INFO printed help (-h/--help)")
+
+
+# Command name (or option-style flag) -> handler(args)
+_COMMANDS = {
+    "log":       _cmd_log,
+    "show":      _cmd_show,
+    "history":   _cmd_history,
+    "version":   _cmd_version,
+    "-V":        _cmd_version,
+    "--version": _cmd_version,
+    "help":      _cmd_help,
+    "commands":  _cmd_help,
+    "-h":        _cmd_help_flag,
+    "--help":    _cmd_help_flag,
+}
+
+
 def main() -> None:
     args = sys.argv[1:]
 
@@ -85,89 +217,18 @@ def main() -> None:
             return
 
         command = args[0]
+        handler = _COMMANDS.get(command)
 
-        # Handle common option-style flags
-        if command in ("-h", "--help"):
-            print_help()
-            log_event("INFO printed help (-h/--help)")
-            return
-
-        if command in ("-V", "--version"):
-            print_version()
-            return
-
-        if command == "log":
-            if len(args) not in (3, 4):
-                msg = "Usage: python3 log_tool.py log <ItemName> <Value> [-YYYY-MM-DD]"
-                print(msg)
-                log_event(f"ERROR {msg}")
-                return
-
-            _, item_name, value_str = args[0:3]
-            log_date = None
-
-            if len(args) == 4:
-                date_flag = args[3]  # expects something like -2026-02-01
-                if not date_flag.startswith("-"):
-                    msg = "Date flag must start with '-' and use YYYY-MM-DD, e.g. -2026-02-01"
-                    print(msg)
-                    log_event(f"ERROR {msg}")
-                    return
-                log_date = date_flag[1:]  # strip the leading '-'
-                # (Optional) validate format here with datetime.date.fromisoformat
-
-            log_item(item_name, value_str, log_date=log_date)
-
-        elif command == "show":
-            # Usage:
-            #   python3 log_tool.py show             -> show today's data across groups
-            #   python3 log_tool.py show 2026-02-01  -> show data for that date
-            if len(args) == 1:
-                show_day()
-            elif len(args) == 2:
-                log_date = args[1]
-                # (Optional) validate date format here
-                show_day(log_date)
-            else:
-                msg = "Usage: python3 log_tool.py show [YYYY-MM-DD]"
-                print(msg)
-                log_event(f"ERROR {msg}")
-
-        elif command == "history":
-            # Usage:
-            #   python3 log_tool.py history       -> last 10 events
-            #   python3 log_tool.py history 20    -> last 20 events
-            if len(args) == 1:
-                show_history()
-            elif len(args) == 2:
-                try:
-                    n = int(args[1])
-                    if n <= 0:
-                        raise ValueError
-                except ValueError:
-                    msg = "history N requires a positive integer N, e.g. 'history 20'."
-                    print(msg)
-                    log_event(f"ERROR {msg}")
-                    return
-                show_history(n)
-            else:
-                msg = "Usage: python3 log_tool.py history [N]"
-                print(msg)
-                log_event(f"ERROR {msg}")
-
-        elif command == "version":
-            print_version()
-
-        elif command in ("help", "commands"):
-            print_help()
-
-        else:
+        if handler is None:
             msg = (
                 f"Unknown command: {command!r}. "
                 "Supported commands: 'log', 'show', 'history', 'version', 'help'."
             )
             print(msg)
             log_event(f"ERROR {msg}")
+            return
+
+        handler(args)
 
     except Exception as e:
         # Catch anything unexpected so it also lands in log.txt
@@ -175,6 +236,10 @@ def main() -> None:
         log_event(err_msg)
         print(err_msg)
 
+    finally:
+        # Write this invocation's events to log.txt in one go
+        flush_events()
+
 
 if __name__ == "__main__":
     main()